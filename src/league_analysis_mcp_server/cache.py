@@ -2,92 +2,295 @@
 Caching Layer for League Analysis MCP Server
 """
 
+import sys
 import time
-import hashlib
+import heapq
 import logging
-from typing import Any, Optional, Dict
+from collections import OrderedDict
+from itertools import count, islice
+from typing import Any, Callable, Optional, Dict, List, Set, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# Plain strings from callers, or structured tuples built by CacheManager
+CacheKey = Union[str, Tuple[Any, ...]]
 
-class SimpleCache:
-    """Simple in-memory cache with TTL support."""
 
-    def __init__(self, default_ttl: int = 300):
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self.default_ttl = default_ttl
+# Containers are sized from at most this many items (evenly spaced for lists and
+# tuples, the first ones otherwise), so sizing cost stays bounded for large
+# rosters/transaction logs instead of walking every element
+_SIZE_SAMPLE = 32
+# Nesting below this depth is not followed; its contents are left uncounted
+_SIZE_MAX_DEPTH = 16
 
-    def _generate_key(self, prefix: str, *args, **kwargs) -> str:
-        """Generate a cache key from prefix and parameters."""
-        key_data = f"{prefix}:{args}:{sorted(kwargs.items())}"
-        return hashlib.md5(key_data.encode()).hexdigest()
+_CONTAINER_TYPES = (dict, list, tuple, set, frozenset)
 
-    def get(self, key: str) -> Optional[Any]:
-        """Get value from cache if not expired."""
-        if key not in self._cache:
+
+def _intern(value: Any) -> Any:
+    """Intern strings for identity-fast key comparisons; pass anything else through."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _estimate_size(value: Any, _depth: int = 0, _seen: Optional[Set[int]] = None) -> int:
+    """
+    Approximate the memory footprint of a cached value in bytes.
+
+    Containers already visited are counted once, so shared or cyclic
+    references cannot recurse forever.
+    """
+    if not isinstance(value, _CONTAINER_TYPES):
+        return sys.getsizeof(value)
+
+    if _seen is None:
+        _seen = set()
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+
+    size = sys.getsizeof(value)
+    length = len(value)
+    if not length or _depth >= _SIZE_MAX_DEPTH:
+        return size
+
+    _depth += 1
+    if isinstance(value, dict):
+        items = list(islice(value.items(), _SIZE_SAMPLE))
+        sampled = sum(_estimate_size(k, _depth, _seen) + _estimate_size(v, _depth, _seen)
+                      for k, v in items)
+        return size + sampled * length // len(items)
+
+    if isinstance(value, (list, tuple)) and length > _SIZE_SAMPLE:
+        sample = value[::length // _SIZE_SAMPLE][:_SIZE_SAMPLE]
+    else:
+        sample = list(islice(value, _SIZE_SAMPLE))
+    sampled = sum(_estimate_size(item, _depth, _seen) for item in sample)
+    return size + sampled * length // len(sample)
+
+
+class CacheEntry:
+    """A cached value with its TTL bookkeeping (times from the cache's clock)."""
+
+    __slots__ = ('value', 'ttl', 'expires', 'created', 'size')
+
+    def __init__(self, value: Any, ttl: int, expires: float, created: float, size: int):
+        self.value = value
+        self.ttl = ttl
+        self.expires = expires
+        self.created = created
+        self.size = size
+
+
+class SimpleCache:
+    """
+    Simple in-memory LRU cache with TTL support.
+
+    max_entries and max_size_bytes bound the expiring pool; permanent entries
+    (ttl <= 0) are never evicted and do not count toward those limits.
+
+    clock returns the current time in seconds; it defaults to time.monotonic
+    and can be replaced to drive expiry deterministically.
+    """
+
+    def __init__(self, default_ttl: int = 300, max_entries: int = 1000,
+                 max_size_bytes: Optional[int] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        # Expiring entries, ordered from least to most recently used
+        self._cache: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+        # Entries with ttl <= 0 never expire and are never evicted
+        self._permanent: Dict[CacheKey, CacheEntry] = {}
+        # Upcoming expirations as (expires, seq, key); seq breaks ties so keys
+        # of different types are never compared. Stale items are skipped on pop.
+        self._expiry_heap: List[Tuple[float, int, CacheKey]] = []
+        self._expiry_seq = count()
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.max_size_bytes = max_size_bytes
+        # Running size totals per pool, so stats and limit checks never rescan
+        self._expiring_bytes = 0
+        self._permanent_bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    def _over_limit(self) -> bool:
+        """
+        Check whether the expiring pool must shrink to respect the limits.
+
+        Only expiring bytes count here: permanent entries are never evicted, so
+        letting them trigger eviction would flush the expiring pool for nothing.
+        """
+        if len(self._cache) > self.max_entries:
+            return True
+        return self.max_size_bytes is not None and self._expiring_bytes > self.max_size_bytes
+
+    def _discard(self, key: CacheKey) -> bool:
+        """Remove key from whichever pool holds it, keeping size totals in sync."""
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._expiring_bytes -= entry.size
+            return True
+
+        entry = self._permanent.pop(key, None)
+        if entry is not None:
+            self._permanent_bytes -= entry.size
+            return True
+
+        return False
+
+    def _sweep_expired(self, now: float) -> None:
+        """Drop expiring entries whose TTL has passed, even if never read again."""
+        heap = self._expiry_heap
+        # Same boundary as get(): an entry is expired only once now > expires
+        while heap and now > heap[0][0]:
+            expires, _, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # The key may have been re-set or evicted since this item was pushed
+            if entry is not None and entry.expires == expires:
+                del self._cache[key]
+                self._expiring_bytes -= entry.size
+                logger.debug("Cache expire: %s", key)
+
+    def _rebuild_expiry_heap(self) -> None:
+        """Rebuild the expiry heap from live entries, dropping stale items."""
+        self._expiry_heap = [(entry.expires, next(self._expiry_seq), key)
+                             for key, entry in self._cache.items()]
+        heapq.heapify(self._expiry_heap)
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """
+        Get value from cache if not expired.
+
+        The stored object itself is returned, not a copy, so callers must treat
+        cached values as read-only.
+        """
+        entry = self._permanent.get(key)
+        if entry is not None:
+            self._hits += 1
+            logger.debug("Cache hit: %s", key)
+            return entry.value
+
+        # Hits dominate here (a miss is followed by an API call anyway)
+        try:
+            entry = self._cache[key]
+        except KeyError:
+            self._misses += 1
             return None
 
-        entry = self._cache[key]
-        if entry['ttl'] > 0 and time.time() > entry['expires']:
+        if self._clock() > entry.expires:
             del self._cache[key]
+            self._expiring_bytes -= entry.size
+            self._misses += 1
             return None
 
-        logger.debug(f"Cache hit: {key}")
-        return entry['value']
+        self._cache.move_to_end(key)
+        self._hits += 1
+        logger.debug("Cache hit: %s", key)
+        return entry.value
 
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
-        """Set value in cache with TTL."""
+    def set(self, key: CacheKey, value: Any, ttl: Optional[int] = None) -> bool:
+        """
+        Set value in cache with TTL.
+
+        Values larger than half of max_size_bytes are not admitted, since storing
+        one would flush most of the cache to make room for it.
+
+        Returns:
+            True if the value was cached
+        """
         if ttl is None:
             ttl = self.default_ttl
 
-        expires = time.time() + ttl if ttl > 0 else 0
-        self._cache[key] = {
-            'value': value,
-            'ttl': ttl,
-            'expires': expires,
-            'created': time.time()
-        }
-        logger.debug(f"Cache set: {key} (TTL: {ttl}s)")
-
-    def delete(self, key: str) -> None:
+        now = self._clock()
+        self._sweep_expired(now)
+        size = _estimate_size(value)
+        self._discard(key)
+
+        if self.max_size_bytes is not None and size > self.max_size_bytes // 2:
+            logger.debug("Cache skip: %s (%d bytes exceeds admission limit)", key, size)
+            return False
+
+        if ttl <= 0:
+            self._permanent[key] = CacheEntry(value, ttl, 0, now, size)
+            self._permanent_bytes += size
+            logger.debug("Cache set: %s (permanent)", key)
+        else:
+            expires = now + ttl
+            self._cache[key] = CacheEntry(value, ttl, expires, now, size)
+            heapq.heappush(self._expiry_heap, (expires, next(self._expiry_seq), key))
+            self._expiring_bytes += size
+            if len(self._expiry_heap) > 2 * len(self._cache):
+                self._rebuild_expiry_heap()
+            logger.debug("Cache set: %s (TTL: %ss)", key, ttl)
+
+        while self._cache and self._over_limit():
+            evicted_key, evicted = self._cache.popitem(last=False)
+            self._expiring_bytes -= evicted.size
+            logger.debug("Cache evict (LRU): %s", evicted_key)
+
+        # Eviction may have claimed the new entry too (e.g. max_entries=0)
+        return ttl <= 0 or key in self._cache
+
+    def delete(self, key: CacheKey) -> None:
         """Remove key from cache."""
-        if key in self._cache:
-            del self._cache[key]
-            logger.debug(f"Cache delete: {key}")
+        if self._discard(key):
+            logger.debug("Cache delete: %s", key)
 
     def clear(self) -> None:
         """Clear all cache entries."""
         self._cache.clear()
+        self._expiry_heap.clear()
+        self._permanent.clear()
+        self._expiring_bytes = 0
+        self._permanent_bytes = 0
         logger.debug("Cache cleared")
 
+    def clear_expiring(self) -> int:
+        """
+        Clear all entries that have a TTL, keeping permanent ones.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = len(self._cache)
+        self._cache.clear()
+        self._expiry_heap.clear()
+        self._expiring_bytes = 0
+        logger.debug("Cache cleared %d expiring entries", removed)
+        return removed
+
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        current_time = time.time()
+        current_time = self._clock()
         active_entries = 0
-        expired_entries = 0
-        permanent_entries = 0
 
         for entry in self._cache.values():
-            if entry['ttl'] == -1:  # Permanent
-                permanent_entries += 1
-            elif entry['ttl'] > 0 and current_time <= entry['expires']:
+            if current_time <= entry.expires:
                 active_entries += 1
-            else:
-                expired_entries += 1
 
         return {
-            'total_entries': len(self._cache),
+            'total_entries': len(self._cache) + len(self._permanent),
             'active_entries': active_entries,
-            'expired_entries': expired_entries,
-            'permanent_entries': permanent_entries
+            'expired_entries': len(self._cache) - active_entries,
+            'permanent_entries': len(self._permanent),
+            'max_entries': self.max_entries,
+            'memory_usage_bytes': self._expiring_bytes + self._permanent_bytes,
+            'max_size_bytes': self.max_size_bytes,
+            'hits': self._hits,
+            'misses': self._misses,
+            'hit_rate': self._hits / max(1, self._hits + self._misses)
         }
 
 
 class CacheManager:
     """Manages different cache strategies for different data types."""
 
-    def __init__(self, historical_ttl: int = -1, current_ttl: int = 300):
-        self.cache = SimpleCache()
+    def __init__(self, historical_ttl: int = -1, current_ttl: int = 300,
+                 max_entries: int = 1000, max_size_mb: int = 100,
+                 clock: Callable[[], float] = time.monotonic):
+        # max_size_mb mirrors cache_settings.max_cache_size_mb in settings.json
+        self.cache = SimpleCache(max_entries=max_entries,
+                                 max_size_bytes=max_size_mb * 1024 * 1024,
+                                 clock=clock)
         self.historical_ttl = historical_ttl  # -1 means permanent
         self.current_ttl = current_ttl
 
@@ -116,47 +319,56 @@ class CacheManager:
         self.cache.set(key, data, self.current_ttl)
 
     def _get_historical_key(self, sport: str, season: str, league_id: str,
-                            endpoint: str, **params) -> str:
+                            endpoint: str, **params) -> Tuple[Any, ...]:
         """Generate cache key for historical data."""
-        return self.cache._generate_key(
-            f"hist_{sport}_{season}_{league_id}_{endpoint}", **params
-        )
+        # Sport and endpoint come from a small fixed vocabulary; interning lets
+        # key comparisons short-circuit on identity for request-decoded strings
+        return ("hist", _intern(sport), season, league_id, _intern(endpoint),
+                tuple(sorted(params.items())))
 
     def _get_current_key(self, sport: str, league_id: str,
-                         endpoint: str, **params) -> str:
+                         endpoint: str, **params) -> Tuple[Any, ...]:
         """Generate cache key for current data."""
-        return self.cache._generate_key(
-            f"curr_{sport}_{league_id}_{endpoint}", **params
-        )
+        return ("curr", _intern(sport), league_id, _intern(endpoint),
+                tuple(sorted(params.items())))
 
     def invalidate_current_season(self, sport: str, league_id: str) -> None:
         """Invalidate all current season cache entries for a league."""
         keys_to_delete = []
-        prefix = f"curr_{sport}_{league_id}_"
+        prefix = ("curr", sport, league_id)
 
-        for key in self.cache._cache.keys():
-            if key.startswith(prefix):
+        for key in [*self.cache._cache, *self.cache._permanent]:
+            if isinstance(key, tuple) and key[:3] == prefix:
                 keys_to_delete.append(key)
 
         for key in keys_to_delete:
             self.cache.delete(key)
 
-        logger.info(f"Invalidated {len(keys_to_delete)} current season cache entries")
+        logger.info("Invalidated %d current season cache entries", len(keys_to_delete))
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache directly (for general cache operations)."""
         return self.cache.get(key)
 
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """Set value in cache directly (for general cache operations)."""
         if ttl is None:
             ttl = self.current_ttl
-        self.cache.set(key, value, ttl)
+        return self.cache.set(key, value, ttl)
 
     def clear(self) -> None:
         """Clear all cache entries."""
         self.cache.clear()
 
+    def clear_current(self) -> int:
+        """
+        Clear current season (expiring) entries, keeping permanent historical data.
+
+        Returns:
+            Number of entries removed
+        """
+        return self.cache.clear_expiring()
+
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get comprehensive cache statistics."""
         return self.cache.get_stats()
@@ -8,7 +8,8 @@ import json
 import time
 import logging
 import requests
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping, Tuple
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -17,6 +18,15 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 
+def copy_credentials(credentials: Mapping[str, Any]) -> Dict[str, Any]:
+    """Copy a credentials mapping, including the nested token dict YFPY updates in place."""
+    copied = dict(credentials)
+    token = copied.get('yahoo_access_token_json')
+    if isinstance(token, dict):
+        copied['yahoo_access_token_json'] = dict(token)
+    return copied
+
+
 class EnhancedYahooAuthManager:
     """Enhanced Yahoo OAuth authentication manager with token refresh."""
 
@@ -36,6 +46,13 @@ class EnhancedYahooAuthManager:
         # Token refresh URLs
         self.token_url = "https://api.login.yahoo.com/oauth2/get_token"
 
+        # Bumped whenever credentials or tokens change so cached state can be invalidated
+        self.refresh_id = 0
+        self._cached_credentials: Optional[Dict[str, Any]] = None
+        self._cached_refresh_id = -1
+        self._cached_token_mtime: Optional[int] = None
+        self._query_kwargs_cache: Dict[Tuple[str, Optional[str], int], Mapping[str, Any]] = {}
+
         if not self.consumer_key or not self.consumer_secret:
             logger.warning("Yahoo consumer key/secret not found in environment variables")
 
@@ -43,9 +60,26 @@ class EnhancedYahooAuthManager:
         """
         Get authentication credentials for YFPY with automatic token refresh.
 
+        The result is cached until the access token expires, refresh_id changes
+        or the token file is modified, so repeated tool calls do not re-read the
+        token file. Callers get their own copy, since YFPY updates the token dict
+        it is given.
+
         Returns:
             Dict containing auth credentials for YFPY initialization
         """
+        return copy_credentials(self._current_credentials())
+
+    def _current_credentials(self) -> Dict[str, Any]:
+        """Resolve the cached credentials dict, recomputing it when stale (not copied)."""
+        cached = self._cached_credentials
+        token_mtime = self._token_file_mtime()
+        if (cached is not None and self._cached_refresh_id == self.refresh_id
+                and self._cached_token_mtime == token_mtime):
+            token = cached.get('yahoo_access_token_json')
+            if token is not None and self.is_token_valid(token):
+                return cached
+
         credentials: Dict[str, Any] = {
             'yahoo_consumer_key': self.consumer_key,
             'yahoo_consumer_secret': self.consumer_secret
@@ -74,8 +108,43 @@ class EnhancedYahooAuthManager:
             except json.JSONDecodeError as e:
                 logger.error(f"Failed to parse access token JSON: {e}")
 
+        # Only changed credentials are a new generation for downstream caches
+        if credentials != cached:
+            self.refresh_id += 1
+        self._cached_credentials = credentials
+        self._cached_refresh_id = self.refresh_id
+        self._cached_token_mtime = token_mtime
         return credentials
 
+    def build_query_kwargs(self, sport: str, game_id: Optional[str] = None) -> Mapping[str, Any]:
+        """
+        Get the YahooFantasySportsQuery keyword arguments for a sport/game.
+
+        The mapping is cached per (sport, game_id, refresh_id), so it is rebuilt
+        only after the credentials change. It is shared and read-only: pass it
+        through copy_credentials() before constructing a query, since YFPY
+        updates the token dict it is given.
+
+        Args:
+            sport: Sport code used as game_code when no game_id is given
+            game_id: Specific Yahoo game ID (optional)
+
+        Returns:
+            Read-only mapping of query kwargs (everything except league_id)
+        """
+        credentials = self._current_credentials()
+        key = (sport, game_id, self.refresh_id)
+        kwargs = self._query_kwargs_cache.get(key)
+        if kwargs is None:
+            # Entries from older refresh_ids can never be hit again
+            self._query_kwargs_cache.clear()
+            if game_id:
+                kwargs = MappingProxyType({'game_id': game_id, **credentials})
+            else:
+                kwargs = MappingProxyType({'game_code': sport, **credentials})
+            self._query_kwargs_cache[key] = kwargs
+        return kwargs
+
     def get_valid_token(self) -> Optional[Dict[str, Any]]:
         """
         Get a valid access token, refreshing if necessary.
@@ -110,6 +179,13 @@ class EnhancedYahooAuthManager:
         logger.warning("Unable to refresh token")
         return None
 
+    def _token_file_mtime(self) -> Optional[int]:
+        """Modification time of the token file, or None if it does not exist."""
+        try:
+            return self.token_file.stat().st_mtime_ns
+        except OSError:
+            return None
+
     def load_token_from_file(self) -> Optional[Dict[str, Any]]:
         """Load token data from JSON file."""
         if not self.token_file.exists():
@@ -130,6 +206,7 @@ class EnhancedYahooAuthManager:
 
             with open(self.token_file, 'w') as f:
                 json.dump(token_data, f, indent=2)
+            self.refresh_id += 1
             logger.debug(f"Token saved to {self.token_file}")
         except IOError as e:
             logger.error(f"Failed to save token file: {e}")
@@ -455,6 +532,7 @@ League Analysis MCP - Yahoo Fantasy Sports API Setup
             # Update instance variables
             self.consumer_key = consumer_key
             self.consumer_secret = consumer_secret
+            self.refresh_id += 1
 
             # Reload environment variables
             load_dotenv(override=True)
@@ -619,6 +697,7 @@ League Analysis MCP - Yahoo Fantasy Sports API Setup
             self.access_token = None
             self.refresh_token = None
             self.access_token_json = None
+            self.refresh_id += 1
 
             # Reload environment variables
             load_dotenv(override=True)
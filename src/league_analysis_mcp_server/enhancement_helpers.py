@@ -6,11 +6,15 @@ readable and actionable across all tools.
 """
 
 import logging
+import weakref
 from typing import Dict, Any, List, Union, Optional
 from yfpy import YahooFantasySportsQuery
 
 logger = logging.getLogger(__name__)
 
+# Player lookups kept per enhancer; the oldest are dropped beyond this
+_PLAYER_CACHE_SIZE = 512
+
 
 def get_player_name(player) -> str:
     """Extract player name safely from YFPY player object."""
@@ -25,6 +29,14 @@ def get_player_name(player) -> str:
 class DataEnhancer:
     """Centralized data enhancement for all YFPY methods."""
 
+    # enhance_data_batch() type -> per-item enhancement method
+    _BATCH_ENHANCERS = {
+        'draft_pick': 'enhance_draft_pick',
+        'team': 'enhance_team_data',
+        'transaction': 'enhance_transaction',
+        'roster_player': 'enhance_roster_player',
+    }
+
     def __init__(self, yahoo_query: YahooFantasySportsQuery, cache_manager=None):
         self.yahoo_query = yahoo_query
         self.cache_manager = cache_manager
@@ -60,8 +72,9 @@ class DataEnhancer:
                     team_names[team_key] = team_name
                 self._team_names_cache = team_names
             except Exception as e:
+                # Not cached, so the next call retries the lookup
                 logger.warning(f"Failed to get team names: {e}")
-                self._team_names_cache = {}
+                return {}
         return self._team_names_cache
 
     def get_player_info(self, player_key: str) -> Dict[str, Any]:
@@ -86,14 +99,17 @@ class DataEnhancer:
                     "player_id": 'Unknown'
                 }
         except Exception as e:
+            # Not cached, so the next call retries the lookup
             logger.warning(f"Failed to get player info for {player_key}: {e}")
-            player_info = {
+            return {
                 "player_name": f'Player {player_key}',
                 "player_position": 'Unknown',
                 "player_team": 'Unknown',
                 "player_id": 'Unknown'
             }
 
+        if len(self._player_cache) >= _PLAYER_CACHE_SIZE:
+            del self._player_cache[next(iter(self._player_cache))]
         self._player_cache[player_key] = player_info
         return player_info
 
@@ -228,21 +244,13 @@ class DataEnhancer:
         """Enhance a batch of data objects based on type."""
         enhanced_data = []
 
+        # Resolve the enhancement method once for the whole batch; unknown types
+        # get the generic enhancement that just cleans up common issues
+        enhance = getattr(self, self._BATCH_ENHANCERS.get(enhancement_type, '_generic_enhance'))
+
         for item in data_list:
             try:
-                if enhancement_type == 'draft_pick':
-                    enhanced_item = self.enhance_draft_pick(item)
-                elif enhancement_type == 'team':
-                    enhanced_item = self.enhance_team_data(item)
-                elif enhancement_type == 'transaction':
-                    enhanced_item = self.enhance_transaction(item)
-                elif enhancement_type == 'roster_player':
-                    enhanced_item = self.enhance_roster_player(item)
-                else:
-                    # Generic enhancement - just clean up common issues
-                    enhanced_item = self._generic_enhance(item)
-
-                enhanced_data.append(enhanced_item)
+                enhanced_data.append(enhance(item))
 
             except Exception as e:
                 logger.warning(f"Failed to enhance {enhancement_type} item: {e}")
@@ -391,3 +399,23 @@ class DataEnhancer:
                     pass
 
         return enhanced
+
+
+# One enhancer per live query object, dropped when the query is collected
+_data_enhancers: "weakref.WeakKeyDictionary[YahooFantasySportsQuery, DataEnhancer]" = weakref.WeakKeyDictionary()
+
+
+def get_data_enhancer(yahoo_query: YahooFantasySportsQuery, cache_manager=None) -> DataEnhancer:
+    """
+    Get the DataEnhancer bound to a query object, creating it on first use.
+
+    The enhancer lives as long as the (memoized) query and keeps its team name
+    and player caches between calls.
+    """
+    enhancer = _data_enhancers.get(yahoo_query)
+    if enhancer is None or enhancer.cache_manager is not cache_manager:
+        # Refer back to the query weakly; a strong reference from the value
+        # would keep the WeakKeyDictionary entry alive forever
+        enhancer = DataEnhancer(weakref.proxy(yahoo_query), cache_manager)
+        _data_enhancers[yahoo_query] = enhancer
+    return enhancer
@@ -8,7 +8,7 @@ from typing import Dict, Any, Optional
 from yfpy import YahooFantasySportsQuery
 from fastmcp import FastMCP
 from .shared_utils import get_yahoo_query, handle_api_error
-from .enhancement_helpers import DataEnhancer, get_player_name
+from .enhancement_helpers import get_data_enhancer, get_player_name
 
 logger = logging.getLogger(__name__)
 
@@ -52,7 +52,7 @@ def register_player_tools(mcp: FastMCP, app_state: Dict[str, Any]):
             draft_analysis = yahoo_query.get_player_draft_analysis(player_key)
 
             # Use DataEnhancer for consistent, readable draft analysis
-            data_enhancer = DataEnhancer(yahoo_query, cache_manager)
+            data_enhancer = get_data_enhancer(yahoo_query, cache_manager)
             enhanced_player = data_enhancer.enhance_player_stats(draft_analysis)
 
             # Add draft-specific analysis fields
@@ -116,7 +116,7 @@ def register_player_tools(mcp: FastMCP, app_state: Dict[str, Any]):
             ownership = yahoo_query.get_player_ownership(player_key)
 
             # Use DataEnhancer for consistent, readable ownership data
-            data_enhancer = DataEnhancer(yahoo_query, cache_manager)
+            data_enhancer = get_data_enhancer(yahoo_query, cache_manager)
             enhanced_ownership = data_enhancer.enhance_player_stats(ownership)
 
             # Add ownership-specific fields
@@ -359,7 +359,7 @@ def register_player_tools(mcp: FastMCP, app_state: Dict[str, Any]):
             stats = yahoo_query.get_player_stats_for_season(player_key)
 
             # Use DataEnhancer for consistent, readable player stats
-            data_enhancer = DataEnhancer(yahoo_query, cache_manager)
+            data_enhancer = get_data_enhancer(yahoo_query, cache_manager)
             enhanced_stats = data_enhancer.enhance_player_stats(stats)
 
             result = {
@@ -10,7 +10,7 @@ from typing import Dict, Any
 from fastmcp import FastMCP
 
 from .enhanced_auth import get_enhanced_auth_manager
-from .cache import get_cache_manager
+from .cache import CacheManager
 from .tools import register_tools
 from .team_tools import register_team_tools
 from .player_tools import register_player_tools
@@ -41,9 +41,14 @@ mcp = FastMCP(
 )
 
 # Global state
+cache_settings = config["cache_settings"]
 app_state = {
     "auth_manager": get_enhanced_auth_manager(),
-    "cache_manager": get_cache_manager(),
+    "cache_manager": CacheManager(
+        historical_ttl=cache_settings["historical_data_ttl"],
+        current_ttl=cache_settings["current_data_ttl"],
+        max_size_mb=cache_settings["max_cache_size_mb"]
+    ),
     "config": config,
     "game_ids": game_ids
 }
@@ -175,17 +180,11 @@ def clear_cache(cache_type: str = "all") -> Dict[str, Any]:
         return {"status": "success", "message": "All cache cleared"}
     elif cache_type == "current":
         # Clear current season data only
-        keys_to_delete = []
-        for key in cache_manager.cache._cache.keys():
-            if key.startswith("curr_"):
-                keys_to_delete.append(key)
-
-        for key in keys_to_delete:
-            cache_manager.cache.delete(key)
+        cleared = cache_manager.clear_current()
 
         return {
             "status": "success",
-            "message": f"Cleared {len(keys_to_delete)} current season cache entries"
+            "message": f"Cleared {cleared} current season cache entries"
         }
     else:
         return {"status": "error", "message": "Invalid cache_type. Use 'all', 'current', or 'historical'"}
@@ -6,17 +6,75 @@ to eliminate code duplication and ensure consistency.
 """
 
 import logging
-from typing import Any, Dict, Optional
+import re
+import weakref
+from typing import Any, Dict, Optional, Tuple
 from yfpy import YahooFantasySportsQuery
 
+from .enhanced_auth import copy_credentials
+
 logger = logging.getLogger(__name__)
 
+# Classifies API error messages by category. The alternatives are anchored
+# lookaheads so that earlier categories win regardless of where they appear.
+_ERROR_CLASSIFIER = re.compile(
+    r'(?=.*?(?:authentication|unauthorized))(?P<authentication>)'
+    r'|(?=.*?(?:rate limit|too many requests))(?P<rate_limit>)'
+    r'|(?=.*?timeout)(?P<timeout>)',
+    re.IGNORECASE | re.DOTALL
+)
+
+
+# Query objects for the current credentials, one per (league_id, sport, game_id)
+_QUERY_CACHE_SIZE = 64
+_query_cache: Dict[Tuple[str, str, Optional[str]], YahooFantasySportsQuery] = {}
+# (auth manager, refresh_id) the cached queries were built for; weak so the
+# cache never keeps an auth manager alive
+_query_cache_owner: Optional[Tuple["weakref.ref[Any]", int]] = None
+
+
+def _get_cached_yahoo_query(league_id: str, auth_manager: Any, sport: str,
+                            game_id: Optional[str]) -> YahooFantasySportsQuery:
+    """
+    Return a Yahoo query object, reused while the credentials are unchanged.
+    
+    The auth manager bumps refresh_id whenever its credentials change; all
+    cached queries are dropped then, so a refreshed token never reuses a
+    stale session.
+    """
+    global _query_cache_owner
+    
+    # Resolving credentials first means refresh_id reflects the current token
+    query_kwargs = auth_manager.build_query_kwargs(sport, game_id)
+    
+    owner = _query_cache_owner
+    if owner is None or owner[0]() is not auth_manager or owner[1] != auth_manager.refresh_id:
+        _query_cache.clear()
+        _query_cache_owner = (weakref.ref(auth_manager), auth_manager.refresh_id)
+    
+    key = (league_id, sport, game_id)
+    yahoo_query = _query_cache.get(key)
+    if yahoo_query is None:
+        if len(_query_cache) >= _QUERY_CACHE_SIZE:
+            del _query_cache[next(iter(_query_cache))]
+        # game_id if provided, otherwise current season via game_code (like tools.py does)
+        yahoo_query = YahooFantasySportsQuery(league_id=league_id, **copy_credentials(query_kwargs))
+        _query_cache[key] = yahoo_query
+        logger.debug("Created Yahoo query for league %s, sport %s, game_id %s", league_id, sport, game_id)
+    else:
+        # YFPY records every response here; don't let a reused query hoard them
+        yahoo_query.executed_queries.clear()
+        logger.debug("Reusing Yahoo query for league %s, sport %s, game_id %s", league_id, sport, game_id)
+    
+    return yahoo_query
+
 
 def get_yahoo_query(league_id: str, app_state: Dict, game_id: Optional[str] = None, sport: str = "nfl") -> YahooFantasySportsQuery:
     """
-    Create a Yahoo Fantasy Sports Query object for API calls.
+    Get a Yahoo Fantasy Sports Query object for API calls.
     
-    Centralized function to eliminate duplication across tool modules.
+    Centralized function to eliminate duplication across tool modules. Query
+    objects are reused across calls with the same league, game and credentials.
     
     Args:
         league_id: Yahoo league ID
@@ -38,26 +96,10 @@ def get_yahoo_query(league_id: str, app_state: Dict, game_id: Optional[str] = No
         if not auth_manager.is_configured():
             raise ValueError("Yahoo authentication not configured. Run check_setup_status() to begin setup.")
             
-        auth_credentials = auth_manager.get_auth_credentials()
-        
-        # Use game_id if provided, otherwise use current season with game_code
-        if game_id:
-            query_params = {**auth_credentials, 'game_id': game_id}
-        else:
-            # For current season queries, always use game_code (like tools.py does)
-            query_params = {**auth_credentials, 'game_code': sport}
-        
-        # Create query object
-        yahoo_query = YahooFantasySportsQuery(
-            league_id=league_id,
-            **query_params
-        )
-        
-        logger.debug(f"Created Yahoo query for league {league_id}, sport {sport}, game_id {game_id}")
-        return yahoo_query
+        return _get_cached_yahoo_query(league_id, auth_manager, sport, game_id)
         
     except Exception as e:
-        logger.error(f"Failed to create Yahoo query: {e}")
+        logger.error("Failed to create Yahoo query: %s", e)
         raise
 
 
@@ -100,22 +142,25 @@ def handle_api_error(operation: str, error: Exception) -> Dict[str, Any]:
         Standardized error response dictionary
     """
     error_message = str(error)
-    logger.error(f"Error in {operation}: {error_message}")
+    logger.error("Error in %s: %s", operation, error_message)
     
     # Categorize common error types
-    if "authentication" in error_message.lower() or "unauthorized" in error_message.lower():
+    match = _ERROR_CLASSIFIER.match(error_message)
+    error_type = match.lastgroup if match else None
+    
+    if error_type == "authentication":
         return {
             "error": f"Authentication required for {operation}. Please check your Yahoo credentials.",
             "error_type": "authentication",
             "operation": operation
         }
-    elif "rate limit" in error_message.lower() or "too many requests" in error_message.lower():
+    elif error_type == "rate_limit":
         return {
             "error": f"Rate limit exceeded for {operation}. Please try again later.",
             "error_type": "rate_limit", 
             "operation": operation
         }
-    elif "timeout" in error_message.lower():
+    elif error_type == "timeout":
         return {
             "error": f"Request timeout for {operation}. Yahoo API may be experiencing issues.",
             "error_type": "timeout",
@@ -8,7 +8,7 @@ from typing import Dict, Any, Optional
 from yfpy import YahooFantasySportsQuery
 from fastmcp import FastMCP
 from .shared_utils import get_yahoo_query, handle_api_error
-from .enhancement_helpers import get_player_name, DataEnhancer
+from .enhancement_helpers import get_player_name, get_data_enhancer
 
 logger = logging.getLogger(__name__)
 
@@ -753,7 +753,7 @@ def register_team_tools(mcp: FastMCP, app_state: Dict[str, Any]):
             team_standings = yahoo_query.get_team_standings(team_id)
 
             # Use DataEnhancer for proper data extraction
-            data_enhancer = DataEnhancer(yahoo_query, cache_manager)
+            data_enhancer = get_data_enhancer(yahoo_query, cache_manager)
             team_name = data_enhancer._decode_name_bytes(getattr(team_standings, 'name', 'Unknown'))
 
             result = {
@@ -827,7 +827,7 @@ def register_team_tools(mcp: FastMCP, app_state: Dict[str, Any]):
             team_stats = yahoo_query.get_team_stats(team_id)
 
             # Use DataEnhancer for proper data extraction
-            data_enhancer = DataEnhancer(yahoo_query, cache_manager)
+            data_enhancer = get_data_enhancer(yahoo_query, cache_manager)
             team_name = data_enhancer._decode_name_bytes(getattr(team_stats, 'name', 'Unknown'))
 
             result = {
@@ -7,7 +7,7 @@ from typing import Dict, Any, Optional, List, Union
 
 from yfpy import YahooFantasySportsQuery
 from fastmcp import FastMCP
-from .enhancement_helpers import DataEnhancer, get_player_name
+from .enhancement_helpers import get_data_enhancer, get_player_name
 from .historical import register_historical_tools
 from .analytics import register_analytics_tools
 
@@ -164,7 +164,7 @@ def register_tools(mcp: FastMCP, app_state: Dict[str, Any]) -> None:
             league_info = yahoo_query.get_league_info()
 
             # Use DataEnhancer for consistent, readable league information
-            data_enhancer = DataEnhancer(yahoo_query, cache_manager)
+            data_enhancer = get_data_enhancer(yahoo_query, cache_manager)
             enhanced_league_info = data_enhancer.enhance_league_info(league_info)
 
             result = {
@@ -222,7 +222,7 @@ def register_tools(mcp: FastMCP, app_state: Dict[str, Any]) -> None:
             standings = yahoo_query.get_league_standings()
 
             # Use DataEnhancer for consistent, readable team results
-            data_enhancer = DataEnhancer(yahoo_query, cache_manager)
+            data_enhancer = get_data_enhancer(yahoo_query, cache_manager)
             teams_data = data_enhancer.enhance_data_batch(standings.teams, 'team')
 
             result = {
@@ -285,7 +285,7 @@ def register_tools(mcp: FastMCP, app_state: Dict[str, Any]) -> None:
             roster = yahoo_query.get_team_roster_by_week(team_id, 1)  # Default to week 1
             
             # Use DataEnhancer for proper roster data extraction
-            data_enhancer = DataEnhancer(yahoo_query, cache_manager)
+            data_enhancer = get_data_enhancer(yahoo_query, cache_manager)
             players_data = []
             for player in roster:
                 enhanced_player = data_enhancer.enhance_roster_player(player)
@@ -450,7 +450,7 @@ def register_tools(mcp: FastMCP, app_state: Dict[str, Any]) -> None:
             picks_data = []
             if draft_results:
                 # Use DataEnhancer for consistent, readable results
-                data_enhancer = DataEnhancer(yahoo_query, cache_manager)
+                data_enhancer = get_data_enhancer(yahoo_query, cache_manager)
                 # Convert Data object to list for enhance_data_batch
                 draft_list = list(draft_results) if draft_results else []
                 picks_data = data_enhancer.enhance_data_batch(draft_list, 'draft_pick')
@@ -519,7 +519,7 @@ def register_tools(mcp: FastMCP, app_state: Dict[str, Any]) -> None:
                 return {"error": "No draft results found"}
 
             # Use DataEnhancer for consistent, readable results
-            data_enhancer = DataEnhancer(yahoo_query, cache_manager)
+            data_enhancer = get_data_enhancer(yahoo_query, cache_manager)
 
             # Get team names for use in both enhancement paths
             team_names = data_enhancer.get_team_names()
@@ -642,7 +642,7 @@ def register_tools(mcp: FastMCP, app_state: Dict[str, Any]) -> None:
             metadata = yahoo_query.get_league_metadata()
 
             # Use DataEnhancer for consistent, readable metadata
-            data_enhancer = DataEnhancer(yahoo_query, cache_manager)
+            data_enhancer = get_data_enhancer(yahoo_query, cache_manager)
             data_enhancer.enhance_league_info(metadata)
 
             result = {
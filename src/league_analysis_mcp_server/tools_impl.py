@@ -8,30 +8,13 @@ to enable proper testing and direct function access.
 
 import logging
 from typing import Dict, Any, Optional, Union, List
-from yfpy import YahooFantasySportsQuery
 
-from .enhancement_helpers import DataEnhancer
+from .enhancement_helpers import get_data_enhancer
+from .shared_utils import get_yahoo_query
 
 logger = logging.getLogger(__name__)
 
 
-def _get_yahoo_query(league_id: str, game_id: Optional[str], sport: str, app_state: Dict[str, Any]) -> YahooFantasySportsQuery:
-    """Create a Yahoo Fantasy Sports Query object."""
-    auth_manager = app_state["auth_manager"]
-    if not auth_manager.is_configured():
-        raise ValueError("Yahoo authentication not configured. Run check_setup_status() to begin setup.")
-    auth_credentials = auth_manager.get_auth_credentials()
-    # Use game_id if provided, otherwise use current season
-    if game_id:
-        query_params = {**auth_credentials, 'game_id': game_id}
-    else:
-        query_params = {**auth_credentials, 'game_code': sport}
-    return YahooFantasySportsQuery(
-        league_id=league_id,
-        **query_params
-    )
-
-
 def get_league_info_impl(league_id: str, sport: str, season: Optional[str], app_state: Dict[str, Any]) -> Dict[str, Any]:
     """
     Implementation of get_league_info MCP tool.
@@ -64,19 +47,17 @@ def get_league_info_impl(league_id: str, sport: str, season: Optional[str], app_
             if not game_id:
                 return {"error": f"No game_id found for {sport} {season}"}
 
-        yahoo_query = _get_yahoo_query(league_id, game_id, sport, app_state)
+        yahoo_query = get_yahoo_query(league_id, app_state, game_id, sport)
         league_info = yahoo_query.get_league_info()
 
         # Use DataEnhancer for consistent, readable league information
-        data_enhancer = DataEnhancer(yahoo_query, cache_manager)
-        enhanced_league_info = data_enhancer.enhance_league_info(league_info)
+        data_enhancer = get_data_enhancer(yahoo_query, cache_manager)
+        result = data_enhancer.enhance_league_info(league_info)
 
-        result = {
-            "league_id": league_id,
-            "sport": sport,
-            "season": season or "current",
-            **enhanced_league_info
-        }
+        # Fill in request context without copying; enhanced values take precedence
+        result.setdefault("league_id", league_id)
+        result.setdefault("sport", sport)
+        result.setdefault("season", season or "current")
 
         # Cache the result
         if season:
@@ -123,11 +104,11 @@ def get_standings_impl(league_id: str, sport: str, season: Optional[str], app_st
             if not game_id:
                 return {"error": f"No game_id found for {sport} {season}"}
 
-        yahoo_query = _get_yahoo_query(league_id, game_id, sport, app_state)
+        yahoo_query = get_yahoo_query(league_id, app_state, game_id, sport)
         standings = yahoo_query.get_league_standings()
 
         # Use DataEnhancer for consistent, readable team results
-        data_enhancer = DataEnhancer(yahoo_query, cache_manager)
+        data_enhancer = get_data_enhancer(yahoo_query, cache_manager)
         teams_data = data_enhancer.enhance_data_batch(standings.teams, 'team')
 
         result = {
@@ -185,11 +166,11 @@ def get_team_roster_impl(league_id: str, team_id: str, sport: str, season: Optio
             if not game_id:
                 return {"error": f"No game_id found for {sport} {season}"}
 
-        yahoo_query = _get_yahoo_query(league_id, game_id, sport, app_state)
+        yahoo_query = get_yahoo_query(league_id, app_state, game_id, sport)
         roster = yahoo_query.get_team_roster_by_week(team_id, 1)  # Default to week 1
         
         # Use DataEnhancer for proper data extraction
-        data_enhancer = DataEnhancer(yahoo_query, cache_manager)
+        data_enhancer = get_data_enhancer(yahoo_query, cache_manager)
         players_data = []
         for player in roster:
             enhanced_player = data_enhancer.enhance_player_stats(player)
@@ -260,7 +241,7 @@ def get_matchups_impl(league_id: str, sport: str, week: Optional[int], season: O
             if not game_id:
                 return {"error": f"No game_id found for {sport} {season}"}
 
-        yahoo_query = _get_yahoo_query(league_id, game_id, sport, app_state)
+        yahoo_query = get_yahoo_query(league_id, app_state, game_id, sport)
 
         # Get current week if not provided
         if not week:
@@ -9,7 +9,7 @@ from yfpy import YahooFantasySportsQuery
 from fastmcp import FastMCP
 
 from .shared_utils import get_yahoo_query, handle_api_error
-from .enhancement_helpers import DataEnhancer
+from .enhancement_helpers import get_data_enhancer
 
 logger = logging.getLogger(__name__)
 
@@ -315,7 +315,7 @@ def register_utility_tools(mcp: FastMCP, app_state: Dict[str, Any]):
             user_teams = yahoo_query.get_user_teams()
 
             # Use DataEnhancer for proper data extraction
-            data_enhancer = DataEnhancer(yahoo_query, cache_manager)
+            data_enhancer = get_data_enhancer(yahoo_query, cache_manager)
             teams_data = []
             if user_teams:
                 for team in user_teams:
@@ -0,0 +1,68 @@
+"""
+Shared pytest fixtures for League Analysis MCP tests
+"""
+
+import pytest
+
+# Imported up front: the module calls load_dotenv() on import, and that has to
+# happen before any test adjusts the environment or it would undo the changes
+from league_analysis_mcp_server.enhanced_auth import EnhancedYahooAuthManager
+
+# Fake consumer credentials so no test depends on a real Yahoo app
+FAKE_CREDENTIALS = {
+    'YAHOO_CONSUMER_KEY': 'fake_key_12345',
+    'YAHOO_CONSUMER_SECRET': 'fake_secret_67890',
+}
+
+# Token variables a developer's .env may provide; tests must not pick them up
+TOKEN_ENV_VARS = ('YAHOO_ACCESS_TOKEN', 'YAHOO_REFRESH_TOKEN', 'YAHOO_ACCESS_TOKEN_JSON')
+
+
+def _build_auth_manager(mp):
+    """Construct an auth manager with the fake credentials in the environment."""
+    for name, value in FAKE_CREDENTIALS.items():
+        mp.setenv(name, value)
+    for name in TOKEN_ENV_VARS:
+        mp.delenv(name, raising=False)
+    
+    return EnhancedYahooAuthManager()
+
+
+@pytest.fixture(scope="session")
+def auth_manager_shared():
+    """Auth manager built once per session for tests that only read from it."""
+    # The environment is only read at construction, so restore it right away
+    with pytest.MonkeyPatch.context() as mp:
+        return _build_auth_manager(mp)
+
+
+@pytest.fixture
+def auth_manager(monkeypatch):
+    """Fresh auth manager for tests that change the environment or auth state."""
+    return _build_auth_manager(monkeypatch)
+
+
+@pytest.fixture(scope="session")
+def self_signed_cert():
+    """Generate the callback server's SSL certificate once per session."""
+    from league_analysis_mcp_server.oauth_callback_server import OAuthCallbackServer
+    
+    server = OAuthCallbackServer()
+    try:
+        server.cert_file, server.key_file = server._create_self_signed_cert()
+    except RuntimeError as e:
+        pytest.skip(f"No SSL certificate backend available: {e}")
+    
+    yield server.cert_file, server.key_file
+    server.cleanup()
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip integration tests unless they are selected explicitly with -m."""
+    if "integration" in config.getoption("markexpr"):
+        return
+    
+    skip_integration = pytest.mark.skip(reason="integration test; run with -m integration")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
@@ -6,14 +6,23 @@ These tests require real Yahoo API credentials and validate actual
 data retrieval and processing with live Yahoo Fantasy Sports data.
 """
 
+import re
 import sys
 import os
 from pathlib import Path
+from unittest import mock
+
+import pytest
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
-from ..functional.base import IntegrationTestCase
+try:
+    from ..functional.base import IntegrationTestCase
+except ImportError:
+    # Needs the functional test package (tests/functional/base.py)
+    pytest.skip("functional test base is not available", allow_module_level=True)
+
 from league_analysis_mcp_server.tools import (
     get_league_info, get_standings, get_team_roster, get_matchups
 )
@@ -22,6 +31,11 @@ from league_analysis_mcp_server.analytics import (
 )
 from league_analysis_mcp_server.server import app_state
 
+pytestmark = pytest.mark.integration
+
+# Substrings that mark an error message as authentication-related
+_AUTH_ERROR_RE = re.compile(r"authentication|token|credentials", re.IGNORECASE)
+
 
 class TestLiveDataRetrieval(IntegrationTestCase):
     """Test live data retrieval from Yahoo API."""
@@ -190,30 +204,16 @@ class TestLiveErrorHandling(IntegrationTestCase):
     
     def test_authentication_error_handling(self):
         """Test authentication error handling with real API."""
-        # Temporarily corrupt access token
-        original_token = os.environ.get("YAHOO_ACCESS_TOKEN")
-        
-        try:
-            os.environ["YAHOO_ACCESS_TOKEN"] = "invalid_token_123"
-            
+        # Temporarily corrupt access token; patch.dict restores it even on failure
+        with mock.patch.dict(os.environ, {"YAHOO_ACCESS_TOKEN": "invalid_token_123"}):
             result = get_league_info(self.test_league_id, "nfl")
             
             # Should get authentication error
             self.assertIn("error", result)
-            error_msg = result["error"].lower()
             
             # Should indicate authentication issue
-            self.assertTrue(
-                any(word in error_msg for word in ["authentication", "token", "credentials"]),
-                f"Should indicate auth issue: {result['error']}"
-            )
-        
-        finally:
-            # Restore original token
-            if original_token:
-                os.environ["YAHOO_ACCESS_TOKEN"] = original_token
-            else:
-                os.environ.pop("YAHOO_ACCESS_TOKEN", None)
+            self.assertRegex(result["error"], _AUTH_ERROR_RE,
+                             f"Should indicate auth issue: {result['error']}")
 
 
 def main():
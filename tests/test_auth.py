@@ -4,201 +4,142 @@ Test Yahoo API authentication without real credentials
 """
 
 import sys
-import os
 from pathlib import Path
+from unittest.mock import Mock, create_autospec
 
-# Add src to path so we can import our modules
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import pytest
+import requests
 
-def test_auth_flow():
-    """Test authentication flow with fake credentials."""
-    print("Testing Yahoo API authentication flow...")
+from conftest import FAKE_CREDENTIALS
+from league_analysis_mcp_server.enhanced_auth import EnhancedYahooAuthManager
+
+_SPORTS = ("nfl", "nba", "mlb", "nhl")
+
+_CACHE_CASES = (
+    ("current", "nfl", "123456", "standings", {"team": "data"}),
+    ("historical", "nba", "654321", "2023", "draft_results", {"draft": "picks"}),
+)
+
+_YAHOO_ENV_VARS = (
+    'YAHOO_CONSUMER_KEY', 'YAHOO_CONSUMER_SECRET',
+    'YAHOO_ACCESS_TOKEN', 'YAHOO_REFRESH_TOKEN', 'YAHOO_ACCESS_TOKEN_JSON',
+)
+
+# (env, is_configured, has_access_token, non-empty credential keys)
+_CREDENTIAL_STATES = (
+    ({}, False, False, set()),
+    (FAKE_CREDENTIALS, True, False, {'yahoo_consumer_key', 'yahoo_consumer_secret'}),
+    (
+        {**FAKE_CREDENTIALS, 'YAHOO_ACCESS_TOKEN_JSON': '{"access_token": "fake_token", "token_type": "bearer"}'},
+        True, True, {'yahoo_consumer_key', 'yahoo_consumer_secret', 'yahoo_access_token_json'},
+    ),
+)
+
+
+@pytest.mark.parametrize(
+    "env, configured, has_token, keys", _CREDENTIAL_STATES, ids=["empty", "consumer_only", "with_token"]
+)
+def test_credential_states(env, configured, has_token, keys, monkeypatch, tmp_path):
+    """Test configuration, token and credential detection for each credential setup."""
+    for name in _YAHOO_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
     
-    # Set fake environment variables
-    os.environ['YAHOO_CONSUMER_KEY'] = 'fake_key_12345'
-    os.environ['YAHOO_CONSUMER_SECRET'] = 'fake_secret_67890'
+    auth_manager = EnhancedYahooAuthManager()
+    auth_manager.token_file = tmp_path / ".yahoo_token.json"
     
-    try:
-        from league_analysis_mcp_server.enhanced_auth import EnhancedYahooAuthManager
-        
-        auth_manager = EnhancedYahooAuthManager()
-        
-        print(f"PASS - Auth manager with fake credentials:")
-        print(f"   - Configured: {auth_manager.is_configured()}")
-        print(f"   - Has token: {auth_manager.has_access_token()}")
-        
-        # Test credential extraction
-        credentials = auth_manager.get_auth_credentials()
-        expected_keys = ['yahoo_consumer_key', 'yahoo_consumer_secret']
-        
-        for key in expected_keys:
-            if key in credentials:
-                print(f"   - {key}: *** (found)")
-            else:
-                print(f"   - {key}: MISSING")
-        
-        return True
-        
-    except Exception as e:
-        print(f"FAIL - Auth flow error: {e}")
-        return False
-
-def test_server_tools_without_yahoo():
-    """Test server tools that don't require Yahoo API."""
-    print("\nTesting server tools without Yahoo API...")
+    assert auth_manager.is_configured() is configured
+    assert auth_manager.has_access_token() is has_token
     
-    try:
-        from league_analysis_mcp_server.server import mcp, app_state
-        
-        # Test server info tool (should work without Yahoo API)
-        print("Testing get_server_info()...")
-        
-        # Import the function directly
-        from league_analysis_mcp_server.server import get_server_info
-        
-        result = get_server_info()
-        
-        if isinstance(result, dict):
-            print("PASS - get_server_info() works:")
-            print(f"   - Server name: {result.get('server', {}).get('name')}")
-            print(f"   - Supported sports: {result.get('supported_sports')}")
-            print(f"   - Auth configured: {result.get('authentication', {}).get('configured')}")
-            return True
-        else:
-            print(f"FAIL - get_server_info() returned unexpected type: {type(result)}")
-            return False
-            
-    except Exception as e:
-        print(f"FAIL - Server tools error: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-def test_game_ids():
-    """Test game ID mappings."""
-    print("\nTesting game ID mappings...")
+    credentials = auth_manager.get_auth_credentials()
+    assert {key for key, value in credentials.items() if value} == keys
+
+
+@pytest.fixture
+def mock_failed_post(monkeypatch):
+    """Make Yahoo's token endpoint reject every request with a 400."""
+    response = Mock(status_code=400, text="Invalid authorization code")
+    mock_post = create_autospec(requests.post, return_value=response)
+    monkeypatch.setattr("league_analysis_mcp_server.enhanced_auth.requests.post", mock_post)
+    return mock_post
+
+
+@pytest.mark.parametrize("code", ["", "invalid", "spaces in code", None], ids=["empty", "short", "spaces", "none"])
+def test_malformed_authorization_code(auth_manager_shared, mock_failed_post, code):
+    """Test that a rejected verification code is sent to Yahoo as-is and does not save tokens."""
+    assert auth_manager_shared.exchange_code_for_tokens(code) is False
+    assert mock_failed_post.call_args.kwargs['data']['code'] == code
+
+
+def test_authentication_reset_cleanup(auth_manager, tmp_path, monkeypatch):
+    """Test that reset_authentication removes stored tokens and credentials."""
+    # The reset reloads the repo's real .env; keep its values out of os.environ
+    load_dotenv = Mock()
+    monkeypatch.setattr("league_analysis_mcp_server.enhanced_auth.load_dotenv", load_dotenv)
+    auth_manager.token_file = tmp_path / ".yahoo_token.json"
+    auth_manager.env_file = tmp_path / ".env"
+    auth_manager.token_file.write_text('{"access_token": "fake_token"}')
+    auth_manager.env_file.write_text(
+        "YAHOO_CONSUMER_KEY=fake_key_12345\nYAHOO_ACCESS_TOKEN=fake_token\nOTHER_SETTING=1\n"
+    )
     
-    try:
-        from league_analysis_mcp_server.server import list_available_seasons
-        
-        # Test each sport
-        sports = ["nfl", "nba", "mlb", "nhl"]
-        
-        for sport in sports:
-            result = list_available_seasons(sport)
-            
-            if "error" not in result:
-                seasons = result.get("available_seasons", {})
-                print(f"PASS - {sport.upper()}: {len(seasons)} seasons available")
-            else:
-                print(f"FAIL - {sport.upper()}: {result['error']}")
-                return False
-        
-        return True
-        
-    except Exception as e:
-        print(f"FAIL - Game IDs error: {e}")
-        return False
-
-def test_cache_operations():
-    """Test advanced cache operations."""
-    print("\nTesting cache operations...")
+    assert auth_manager.reset_authentication()
     
-    try:
-        from league_analysis_mcp_server.cache import get_cache_manager
-        
-        cache_manager = get_cache_manager()
-        
-        # Test different cache scenarios
-        test_cases = [
-            ("current", "nfl", "123456", "standings", {"team": "data"}),
-            ("historical", "nba", "654321", "2023", "draft_results", {"draft": "picks"}),
-        ]
-        
-        for cache_type, sport, league_id, *args in test_cases:
-            if cache_type == "current":
-                endpoint, data = args
-                cache_manager.set_current_data(sport, league_id, endpoint, data)
-                retrieved = cache_manager.get_current_data(sport, league_id, endpoint)
-            else:
-                season, endpoint, data = args
-                cache_manager.set_historical_data(sport, season, league_id, endpoint, data)
-                retrieved = cache_manager.get_historical_data(sport, season, league_id, endpoint)
-            
-            if retrieved == data:
-                print(f"PASS - {cache_type} cache: {sport}/{endpoint}")
-            else:
-                print(f"FAIL - {cache_type} cache mismatch: {sport}/{endpoint}")
-                return False
-        
-        # Test cache stats
-        stats = cache_manager.get_cache_stats()
-        print(f"PASS - Cache stats: {stats['total_entries']} entries")
-        
-        return True
-        
-    except Exception as e:
-        print(f"FAIL - Cache operations error: {e}")
-        return False
-
-def main():
-    """Run authentication and offline testing."""
-    print("League Analysis MCP - Authentication & Offline Testing")
-    print("=" * 60)
+    assert not auth_manager.token_file.exists()
+    assert auth_manager.env_file.read_text() == "OTHER_SETTING=1\n"
+    load_dotenv.assert_called_once_with(override=True)
+    assert not auth_manager.is_configured()
+    assert not auth_manager.has_access_token()
+
+
+def test_ssl_certificate_generation(self_signed_cert):
+    """Test that the OAuth callback server can create its HTTPS certificate."""
+    cert_file, key_file = self_signed_cert
     
-    tests = [
-        ("Authentication Flow", test_auth_flow),
-        ("Server Tools (Offline)", test_server_tools_without_yahoo),
-        ("Game ID Mappings", test_game_ids),
-        ("Cache Operations", test_cache_operations),
-    ]
+    assert Path(cert_file).read_bytes().startswith(b"-----BEGIN CERTIFICATE-----")
+    assert b"PRIVATE KEY-----" in Path(key_file).read_bytes()
+
+
+def test_server_tools_without_yahoo():
+    """Test server tools that don't require Yahoo API."""
+    from league_analysis_mcp_server.server import get_server_info
     
-    results = []
-    for test_name, test_func in tests:
-        print(f"\n{test_name}:")
-        try:
-            result = test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"FAIL - {test_name} failed: {e}")
-            results.append((test_name, False))
+    result = get_server_info()
     
-    # Summary
-    passed = sum(1 for _, result in results if result)
-    total = len(results)
+    assert isinstance(result, dict), f"get_server_info() returned unexpected type: {type(result)}"
+
+
+@pytest.mark.parametrize("sport", _SPORTS)
+def test_game_ids(sport):
+    """Test game ID mappings."""
+    from league_analysis_mcp_server.server import list_available_seasons
     
-    print("\n" + "=" * 60)
-    print("AUTHENTICATION & OFFLINE TEST RESULTS")
-    print("=" * 60)
+    result = list_available_seasons(sport)
     
-    for test_name, result in results:
-        status = "PASS" if result else "FAIL"
-        print(f"{status} - {test_name}")
+    assert "error" not in result, f"{sport.upper()}: {result.get('error')}"
+
+
+@pytest.mark.parametrize("case", _CACHE_CASES, ids=lambda case: case[0])
+def test_cache_operations(case):
+    """Test advanced cache operations."""
+    from league_analysis_mcp_server.cache import get_cache_manager
     
-    print(f"\nSummary: {passed}/{total} offline tests passed")
+    cache_manager = get_cache_manager()
+    cache_type, sport, league_id, *args = case
     
-    if passed == total:
-        print("\nAll offline tests passed!")
-        print("\nNext Steps for Full Testing:")
-        print("1. Get Yahoo Developer credentials:")
-        print("   - Go to https://developer.yahoo.com/apps/")
-        print("   - Create new app with redirect_uri: 'https://localhost:8080/'")
-        print("   - Copy Consumer Key & Secret")
-        print()
-        print("2. Create .env file:")
-        print("   cp .env.example .env")
-        print("   # Edit .env with your credentials")
-        print()
-        print("3. Test with real Yahoo API:")
-        print("   uv run python -c \"from src.server import *; print(get_setup_instructions())\"")
-        print()
-        print("4. Start the MCP server:")
-        print("   uv run python -m src.server")
-        
+    if cache_type == "current":
+        endpoint, data = args
+        cache_manager.set_current_data(sport, league_id, endpoint, data)
+        retrieved = cache_manager.get_current_data(sport, league_id, endpoint)
     else:
-        print(f"\nWARNING: {total - passed} offline tests failed.")
+        season, endpoint, data = args
+        cache_manager.set_historical_data(sport, season, league_id, endpoint, data)
+        retrieved = cache_manager.get_historical_data(sport, season, league_id, endpoint)
     
-    return 0 if passed == total else 1
+    assert retrieved == data, f"{cache_type} cache mismatch: {sport}/{endpoint}"
+    assert cache_manager.get_cache_stats()['total_entries'] > 0
+
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-v"]))
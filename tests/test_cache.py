@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Test the LRU/TTL cache and the cache manager, driven by a fake clock
+"""
+
+import sys
+
+import pytest
+
+from league_analysis_mcp_server.cache import CacheManager, SimpleCache
+
+# Plain strings are sized with sys.getsizeof, so every VALUE costs SIZE bytes
+VALUE = "x" * 100
+SIZE = sys.getsizeof(VALUE)
+
+
+class FakeClock:
+    """Clock that only moves when a test advances it."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+    
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_get_refreshes_lru_order(clock):
+    """Test that reading an entry protects it from the next eviction."""
+    cache = SimpleCache(max_entries=2, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_eviction_by_max_entries(clock):
+    """Test that the least recently used entry is evicted past max_entries."""
+    cache = SimpleCache(max_entries=3, clock=clock)
+    for key in ("a", "b", "c", "d"):
+        assert cache.set(key, key.upper())
+    
+    assert cache.get("a") is None
+    assert [cache.get(key) for key in ("b", "c", "d")] == ["B", "C", "D"]
+    assert cache.get_stats()['total_entries'] == 3
+
+
+def test_eviction_by_max_size_bytes(clock):
+    """Test that entries are evicted until the size limit is respected."""
+    cache = SimpleCache(max_size_bytes=3 * SIZE, clock=clock)
+    for key in ("a", "b", "c", "d"):
+        assert cache.set(key, VALUE)
+    
+    assert cache.get("a") is None
+    assert cache.get("d") == VALUE
+    stats = cache.get_stats()
+    assert stats['total_entries'] == 3
+    assert stats['memory_usage_bytes'] == 3 * SIZE
+
+
+def test_permanent_entries_never_evict_and_are_never_evicted(clock):
+    """Test that permanent entries sit outside both limits and never expire."""
+    cache = SimpleCache(max_entries=2, max_size_bytes=3 * SIZE, clock=clock)
+    for key in ("p1", "p2", "p3", "p4"):
+        assert cache.set(key, VALUE, ttl=-1)
+    
+    # Permanent entries exceed both limits, yet expiring ones still fit
+    assert cache.set("a", VALUE, ttl=60)
+    assert cache.set("b", VALUE, ttl=60)
+    assert cache.get("a") == VALUE
+    
+    # Over max_entries: only the expiring pool is evicted from
+    cache.set("c", VALUE, ttl=60)
+    assert cache.get("b") is None
+    assert cache.get("a") == VALUE
+    assert cache.get("c") == VALUE
+    
+    clock.advance(10 ** 6)
+    assert all(cache.get(key) == VALUE for key in ("p1", "p2", "p3", "p4"))
+    assert cache.get_stats()['permanent_entries'] == 4
+
+
+def test_set_rejects_values_over_half_max_size(clock):
+    """Test that values larger than max_size_bytes // 2 are not admitted."""
+    cache = SimpleCache(max_size_bytes=2 * SIZE - 2, clock=clock)
+    assert cache.set("small", "x")
+    assert cache.set("big", "stale")
+    
+    assert cache.set("big", VALUE) is False
+    assert cache.set("forever", VALUE, ttl=-1) is False
+    
+    # The rejected value replaces nothing: the old one must not be served
+    assert cache.get("big") is None
+    assert cache.get("forever") is None
+    assert cache.get("small") == "x"
+    
+    # Exactly half is still admitted
+    assert SimpleCache(max_size_bytes=2 * SIZE, clock=clock).set("big", VALUE)
+
+
+def test_set_sweeps_expired_entries(clock):
+    """Test that set drops expired entries, even unread ones, from the size total."""
+    cache = SimpleCache(clock=clock)
+    cache.set("a", VALUE, ttl=10)
+    cache.set("b", VALUE, ttl=20)
+    
+    # An entry is still live at exactly its expiry time
+    clock.advance(10)
+    assert cache.get("a") == VALUE
+    
+    clock.advance(11)
+    stats = cache.get_stats()
+    assert stats['expired_entries'] == 2
+    assert stats['memory_usage_bytes'] == 2 * SIZE
+    
+    cache.set("c", "x", ttl=10)
+    
+    stats = cache.get_stats()
+    assert stats['total_entries'] == 1
+    assert stats['expired_entries'] == 0
+    assert stats['memory_usage_bytes'] == sys.getsizeof("x")
+
+
+def test_hit_and_miss_stats(clock):
+    """Test hit/miss counting, including a read of an expired entry."""
+    cache = SimpleCache(clock=clock)
+    assert cache.get_stats()['hit_rate'] == 0
+    
+    cache.get("a")
+    cache.set("a", 1, ttl=10)
+    cache.set("p", 2, ttl=-1)
+    cache.get("a")
+    cache.get("p")
+    clock.advance(11)
+    cache.get("a")
+    
+    stats = cache.get_stats()
+    assert stats['hits'] == 2
+    assert stats['misses'] == 2
+    assert stats['hit_rate'] == 0.5
+
+
+def test_clear_expiring_keeps_permanent_entries(clock):
+    """Test that clear_expiring only removes entries with a TTL."""
+    cache = SimpleCache(clock=clock)
+    cache.set("a", VALUE, ttl=10)
+    cache.set("b", VALUE, ttl=10)
+    cache.set("p", VALUE, ttl=-1)
+    
+    assert cache.clear_expiring() == 2
+    
+    assert cache.get("a") is None
+    assert cache.get("p") == VALUE
+    assert cache.get_stats()['memory_usage_bytes'] == SIZE
+
+
+def test_clear_current_keeps_historical_data(clock):
+    """Test that CacheManager.clear_current drops current season data only."""
+    manager = CacheManager(clock=clock)
+    manager.set_historical_data("nfl", "2022", "12345", "standings", VALUE)
+    manager.set_current_data("nfl", "12345", "standings", VALUE)
+    manager.set_current_data("nfl", "12345", "matchups", VALUE, week=3)
+    
+    assert manager.clear_current() == 2
+    
+    assert manager.get_current_data("nfl", "12345", "standings") is None
+    assert manager.get_historical_data("nfl", "2022", "12345", "standings") == VALUE
+
+
+def test_invalidate_current_season(clock):
+    """Test that only the given league's current season entries are invalidated."""
+    manager = CacheManager(clock=clock)
+    manager.set_current_data("nfl", "12345", "standings", VALUE)
+    manager.set_current_data("nfl", "12345", "matchups", VALUE, week=3)
+    manager.set_current_data("nfl", "67890", "standings", VALUE)
+    manager.set_current_data("nba", "12345", "standings", VALUE)
+    manager.set_historical_data("nfl", "2022", "12345", "standings", VALUE)
+    
+    manager.invalidate_current_season("nfl", "12345")
+    
+    assert manager.get_current_data("nfl", "12345", "standings") is None
+    assert manager.get_current_data("nfl", "12345", "matchups", week=3) is None
+    assert manager.get_current_data("nfl", "67890", "standings") == VALUE
+    assert manager.get_current_data("nba", "12345", "standings") == VALUE
+    assert manager.get_historical_data("nfl", "2022", "12345", "standings") == VALUE
+
+
+def test_current_data_expires_after_ttl(clock):
+    """Test that current season data honours current_ttl on the injected clock."""
+    manager = CacheManager(current_ttl=300, clock=clock)
+    manager.set_current_data("nfl", "12345", "standings", VALUE)
+    
+    clock.advance(300)
+    assert manager.get_current_data("nfl", "12345", "standings") == VALUE
+    clock.advance(1)
+    assert manager.get_current_data("nfl", "12345", "standings") is None
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
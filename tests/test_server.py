@@ -115,14 +115,24 @@ def test_cache_manager():
         cache.set_current_data("nfl", "123456", "test_endpoint", test_data)
         retrieved = cache.get_current_data("nfl", "123456", "test_endpoint")
         
-        if retrieved == test_data:
+        if retrieved != test_data:
+            print("FAIL - Cache data mismatch")
+            return False
+        
+        # Current season data should expire once the TTL passes
+        now = [1000.0]
+        clocked = CacheManager(current_ttl=300, clock=lambda: now[0])
+        clocked.set_current_data("nfl", "123456", "test_endpoint", test_data)
+        now[0] += 400
+        
+        if clocked.get_current_data("nfl", "123456", "test_endpoint") is None:
             print("PASS - Cache manager working correctly")
             
             stats = cache.get_cache_stats()
             print(f"   - Cache stats: {stats}")
             return True
         else:
-            print("FAIL - Cache data mismatch")
+            print("FAIL - Cache entry outlived its TTL")
             return False
             
     except Exception as e:
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Test shared helpers used across the tool modules
+"""
+
+import json
+import sys
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from league_analysis_mcp_server import shared_utils
+from league_analysis_mcp_server.enhanced_auth import EnhancedYahooAuthManager
+from league_analysis_mcp_server.shared_utils import get_yahoo_query, handle_api_error
+
+# (message, expected error_type); several categories match in most messages,
+# and authentication > rate_limit > timeout must win regardless of position
+_ERROR_MESSAGES = (
+    ("Unauthorized: rate limit exceeded after timeout", "authentication"),
+    ("timeout while rate limit applied, then authentication failed", "authentication"),
+    ("401 rate limit timeout", "rate_limit"),
+    ("Request timeout: too many requests", "rate_limit"),
+    ("Read TIMEOUT from Yahoo", "timeout"),
+    ("Something else broke", "general"),
+)
+
+
+@pytest.mark.parametrize("message, error_type", _ERROR_MESSAGES)
+def test_error_classification_precedence(message, error_type):
+    """Test that API errors are classified by category precedence, not position."""
+    result = handle_api_error("get_standings", Exception(message))
+
+    assert result["error_type"] == error_type
+    assert result["operation"] == "get_standings"
+
+
+def _token(**overrides):
+    """Token as saved by the OAuth flow, valid for an hour unless overridden."""
+    token = {
+        'access_token': 'access_abc',
+        'refresh_token': 'refresh_xyz',
+        'token_type': 'bearer',
+        'expires_in': 3600,
+        'saved_at': int(time.time()),
+    }
+    token.update(overrides)
+    return token
+
+
+@pytest.fixture
+def query_factory(monkeypatch):
+    """Patch YahooFantasySportsQuery with a mock that records each construction."""
+    factory = Mock(side_effect=lambda **kwargs: Mock(executed_queries=[]))
+    monkeypatch.setattr(shared_utils, "YahooFantasySportsQuery", factory)
+    monkeypatch.setattr(shared_utils, "_query_cache", {})
+    monkeypatch.setattr(shared_utils, "_query_cache_owner", None)
+    return factory
+
+
+@pytest.fixture
+def token_auth_manager(auth_manager, tmp_path):
+    """Auth manager reading a valid token from a temporary token file."""
+    auth_manager.token_file = tmp_path / ".yahoo_token.json"
+    auth_manager.env_file = tmp_path / ".env"
+    auth_manager.token_file.write_text(json.dumps(_token()))
+    return auth_manager
+
+
+def test_query_reused_for_same_league(query_factory, token_auth_manager):
+    """Test that a cached query is reused and its executed_queries are cleared."""
+    app_state = {"auth_manager": token_auth_manager}
+    
+    query = get_yahoo_query("12345", app_state, sport="nfl")
+    query.executed_queries.append({"url": "league/standings"})
+    
+    assert get_yahoo_query("12345", app_state, sport="nfl") is query
+    assert query.executed_queries == []
+    assert query_factory.call_count == 1
+    
+    # A different league, sport or game_id is a different query
+    get_yahoo_query("67890", app_state, sport="nfl")
+    get_yahoo_query("12345", app_state, sport="nba")
+    get_yahoo_query("12345", app_state, game_id="423", sport="nfl")
+    assert query_factory.call_count == 4
+
+
+def test_query_cache_dropped_on_refresh_id_bump(query_factory, token_auth_manager):
+    """Test that new credentials (a refresh_id bump) drop every cached query."""
+    app_state = {"auth_manager": token_auth_manager}
+    query = get_yahoo_query("12345", app_state, sport="nfl")
+    
+    token_auth_manager.refresh_id += 1
+    
+    assert get_yahoo_query("12345", app_state, sport="nfl") is not query
+    assert query_factory.call_count == 2
+
+
+def test_query_cache_dropped_for_new_auth_manager(query_factory, token_auth_manager):
+    """Test that queries built for one auth manager are not handed to another."""
+    query = get_yahoo_query("12345", {"auth_manager": token_auth_manager}, sport="nfl")
+    
+    # The auth_manager fixture's fake environment is still in place
+    other_manager = EnhancedYahooAuthManager()
+    other_manager.token_file = token_auth_manager.token_file
+    other_manager.refresh_id = token_auth_manager.refresh_id
+    
+    assert get_yahoo_query("12345", {"auth_manager": other_manager}, sport="nfl") is not query
+    assert query_factory.call_count == 2
+
+
+def test_returned_credentials_are_copies(query_factory, token_auth_manager):
+    """Test that mutating returned credentials does not touch the cached ones."""
+    credentials = token_auth_manager.get_auth_credentials()
+    credentials['yahoo_consumer_key'] = 'mutated'
+    credentials['yahoo_access_token_json']['access_token'] = 'mutated'
+    
+    cached = token_auth_manager._cached_credentials
+    assert cached['yahoo_consumer_key'] == 'fake_key_12345'
+    assert cached['yahoo_access_token_json']['access_token'] == 'access_abc'
+    
+    # The kwargs handed to YahooFantasySportsQuery are copies as well
+    get_yahoo_query("12345", {"auth_manager": token_auth_manager}, sport="nfl")
+    query_kwargs = query_factory.call_args.kwargs
+    query_kwargs['yahoo_access_token_json']['access_token'] = 'mutated'
+    assert cached['yahoo_access_token_json']['access_token'] == 'access_abc'
+
+
+def test_expired_token_forces_rebuild(query_factory, token_auth_manager, monkeypatch):
+    """Test that an expired token is refreshed and the query rebuilt with it."""
+    app_state = {"auth_manager": token_auth_manager}
+    query = get_yahoo_query("12345", app_state, sport="nfl")
+    
+    # Expire the token behind the cached credentials and the token file
+    expired = _token(saved_at=int(time.time()) - 7200)
+    token_auth_manager._cached_credentials['yahoo_access_token_json'].update(expired)
+    token_auth_manager.token_file.write_text(json.dumps(expired))
+    refresh = Mock(return_value=_token(access_token='access_new'))
+    monkeypatch.setattr(token_auth_manager, "refresh_access_token", refresh)
+    
+    assert get_yahoo_query("12345", app_state, sport="nfl") is not query
+    
+    refresh.assert_called_once()
+    assert query_factory.call_count == 2
+    assert query_factory.call_args.kwargs['yahoo_access_token_json']['access_token'] == 'access_new'
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
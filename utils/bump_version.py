@@ -10,28 +10,19 @@ import sys
 from pathlib import Path
 from typing import Tuple
 
-
-def get_current_version() -> str:
-    """Extract current version from pyproject.toml"""
-    pyproject_path = Path("pyproject.toml")
-    if not pyproject_path.exists():
-        raise FileNotFoundError("pyproject.toml not found")
-    
-    content = pyproject_path.read_text()
-    match = re.search(r'^version\s*=\s*"([^"]+)"', content, re.MULTILINE)
-    if not match:
-        raise ValueError("Version not found in pyproject.toml")
-    
-    return match.group(1)
+_VERSION_RE = re.compile(rb'^version\s*=\s*"([^"]+)"', re.MULTILINE)
+_SEMVER_RE = re.compile(r'^(\d+)\.(\d+)\.(\d+)$', re.ASCII)
+_SETTINGS_VERSION_RE = re.compile(rb'("version"\s*:\s*)"[^"]+"')
+_BUMP_TYPES = frozenset(("major", "minor", "patch"))
 
 
 def parse_version(version: str) -> Tuple[int, int, int]:
     """Parse semantic version string into tuple"""
-    parts = version.split(".")
-    if len(parts) != 3:
+    match = _SEMVER_RE.fullmatch(version)
+    if not match:
         raise ValueError(f"Invalid version format: {version}")
     
-    major, minor, patch = int(parts[0]), int(parts[1]), int(parts[2])
+    major, minor, patch = map(int, match.groups())
     return (major, minor, patch)
 
 
@@ -54,19 +45,35 @@ def bump_version(current_version: str, bump_type: str) -> str:
         raise ValueError(f"Invalid bump type: {bump_type}. Use: major, minor, patch")
 
 
-def update_pyproject_version(new_version: str) -> None:
-    """Update version in pyproject.toml"""
+def read_and_bump_version(bump_or_version: str) -> Tuple[str, str, bytes]:
+    """Read pyproject.toml once and return (current, new, updated content)"""
     pyproject_path = Path("pyproject.toml")
-    content = pyproject_path.read_text()
+    if not pyproject_path.exists():
+        raise FileNotFoundError("pyproject.toml not found")
     
-    updated_content = re.sub(
-        r'^version\s*=\s*"[^"]+"',
-        f'version = "{new_version}"',
-        content,
-        flags=re.MULTILINE
-    )
+    content = pyproject_path.read_bytes()
+    match = _VERSION_RE.search(content)
+    if not match:
+        raise ValueError("Version not found in pyproject.toml")
+    
+    current_version = match.group(1).decode('ascii')
+    
+    # Check if argument is a bump type or specific version
+    if bump_or_version in _BUMP_TYPES:
+        new_version = bump_version(current_version, bump_or_version)
+    else:
+        # Validate it's a proper version format
+        parse_version(bump_or_version)  # This will raise if invalid
+        new_version = bump_or_version
+    
+    updated_content = _VERSION_RE.sub(f'version = "{new_version}"'.encode('ascii'), content)
     
-    pyproject_path.write_text(updated_content)
+    return current_version, new_version, updated_content
+
+
+def update_pyproject_version(new_version: str, updated_content: bytes) -> None:
+    """Write the updated content produced by read_and_bump_version to pyproject.toml"""
+    Path("pyproject.toml").write_bytes(updated_content)
     print(f"Updated pyproject.toml: version = \"{new_version}\"")
 
 
@@ -83,13 +90,20 @@ def update_settings_version(new_version: str) -> None:
             print(f"Warning: {settings_path_str} not found, skipping")
             continue
         
-        with open(settings_path, "r") as f:
-            settings = json.load(f)
+        content = settings_path.read_bytes()
+        updated_content, count = _SETTINGS_VERSION_RE.subn(
+            rb'\g<1>"' + new_version.encode('ascii') + rb'"', content, count=1
+        )
         
-        settings["server"]["version"] = new_version
-        
-        with open(settings_path, "w") as f:
-            json.dump(settings, f, indent=2)
+        if count:
+            settings_path.write_bytes(updated_content)
+        else:
+            # Fall back to a full round-trip if the layout no longer matches
+            settings = json.loads(content)
+            settings["server"]["version"] = new_version
+            
+            with open(settings_path, "w") as f:
+                json.dump(settings, f, indent=2)
         
         print(f"Updated {settings_path_str}: version = \"{new_version}\"")
 
@@ -125,21 +139,12 @@ def main():
     arg = sys.argv[1].lower()
     
     try:
-        current_version = get_current_version()
+        current_version, new_version, pyproject_content = read_and_bump_version(arg)
         print(f"Current version: {current_version}")
-        
-        # Check if argument is a bump type or specific version
-        if arg in ["major", "minor", "patch"]:
-            new_version = bump_version(current_version, arg)
-        else:
-            # Validate it's a proper version format
-            parse_version(arg)  # This will raise if invalid
-            new_version = arg
-        
         print(f"New version: {new_version}")
         
         # Update all files
-        update_pyproject_version(new_version)
+        update_pyproject_version(new_version, pyproject_content)
         update_settings_version(new_version)
         update_release_version(new_version)
         